@@ -9,24 +9,53 @@ import logging
 import time
 
 from collections.abc import Awaitable, Callable
+from typing import Protocol
 
 from bleak import BleakClient, BleakGATTCharacteristic, BLEDevice
 from bleak.exc import BleakError
 
-from .const import BLE_DATA_RECEIVE
+from .const import BLE_DATA_RECEIVE, NOTIFY_DEBOUNCE, RECONNECT_DELAY
 from .exceptions import ProbePlusDeviceNotFound, ProbePlusError
 from .parser import ParserBase, ProbePlusData
 
 _LOGGER = logging.getLogger(__name__)
 
+class NotifyCallback(Protocol):
+    """Callback invoked when the device state changes.
+
+    The callback takes no arguments, read the new values from device_state.
+    """
+
+    def __call__(self) -> None: ...
+
 class ProbePlusDevice:
     """Representation of a Probe Plus device."""
 
+    __slots__ = (
+        "_client",
+        "_address_or_ble_device",
+        "_mac",
+        "name",
+        "heartbeat_task",
+        "process_queue_task",
+        "connected",
+        "_timestamp_last_command",
+        "last_disconnect_time",
+        "_reconnect_delay",
+        "_device_state",
+        "_queue",
+        "_last_short_msg",
+        "_notify_callback",
+        "_extra_callbacks",
+        "_notify_handle",
+    )
+
     def __init__(
         self,
         address_or_ble_device: str | BLEDevice,
         name: str | None = None,
-        notify_callback: Callable[[], None] | None = None,
+        notify_callback: NotifyCallback | None = None,
+        reconnect_delay: float = RECONNECT_DELAY,
     ) -> None:
         """Initialize the probe."""
 
@@ -43,31 +72,78 @@ class ProbePlusDevice:
         self.connected = False
         self._timestamp_last_command: float | None = None
         self.last_disconnect_time: float | None = None
+        self._reconnect_delay = reconnect_delay
 
         self._device_state: ParserBase | None = ParserBase()
 
-        # queue
-        self._queue: asyncio.Queue = asyncio.Queue()
-        self._add_to_queue_lock = asyncio.Lock()
+        # queue, created on connect so it binds to the running loop
+        self._queue: asyncio.Queue | None = None
 
         self._last_short_msg: bytearray | None = None
 
-        self._notify_callback: Callable[[], None] | None = notify_callback
+        # the first callback is kept in a plain field, any further callbacks
+        # spill into a dict keyed by id() for O(1) unregister
+        self._notify_callback: NotifyCallback | None = None
+        self._extra_callbacks: dict[int, NotifyCallback] | None = None
+        if notify_callback is not None:
+            self.register_callback(notify_callback)
+        self._notify_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def address_or_ble_device(self) -> str | BLEDevice:
+        """Return the address or BLE device used to connect."""
+        return self._address_or_ble_device
+
+    @address_or_ble_device.setter
+    def address_or_ble_device(self, address_or_ble_device: str | BLEDevice) -> None:
+        """Set the address or BLE device and refresh the cached mac."""
+        self._address_or_ble_device = address_or_ble_device
+        self._mac = (
+            address_or_ble_device.upper()
+            if isinstance(address_or_ble_device, str)
+            else address_or_ble_device.address.upper()
+        )
 
     @property
     def mac(self) -> str:
         """Return the mac address of the probe in upper case."""
-        return (
-            self.address_or_ble_device.upper()
-            if isinstance(self.address_or_ble_device, str)
-            else self.address_or_ble_device.address.upper()
-        )
+        return self._mac
 
     @property
     def device_state(self) -> ProbePlusData | None:
         """Return the device info of the probe."""
         return self._device_state.state
 
+    def register_callback(self, callback: NotifyCallback) -> Callable[[], None]:
+        """Register a callback for state updates, returns a function to unregister it."""
+        if self._notify_callback is None:
+            self._notify_callback = callback
+        else:
+            if self._extra_callbacks is None:
+                self._extra_callbacks = {}
+            self._extra_callbacks[id(callback)] = callback
+
+        def unregister() -> None:
+            if self._notify_callback is callback:
+                self._notify_callback = None
+            elif self._extra_callbacks is not None:
+                self._extra_callbacks.pop(id(callback), None)
+
+        return unregister
+
+    def _fire_callbacks(self) -> None:
+        """Call all registered callbacks."""
+        if self._notify_callback is not None:
+            self._notify_callback()
+        if self._extra_callbacks:
+            for callback in list(self._extra_callbacks.values()):
+                callback()
+
+    def _flush_callbacks(self) -> None:
+        """Fire callbacks for the state updates received in the debounce window."""
+        self._notify_handle = None
+        self._fire_callbacks()
+
     def device_disconnected_handler(
         self,
         client: BleakClient | None = None,  # pylint: disable=unused-argument
@@ -82,13 +158,16 @@ class ProbePlusDevice:
         self.connected = False
         self.last_disconnect_time = time.time()
         self.async_empty_queue_and_cancel_tasks()
-        if notify and self._notify_callback:
-            self._notify_callback()
+        if self._notify_handle is not None:
+            self._notify_handle.cancel()
+            self._notify_handle = None
+        if notify:
+            self._fire_callbacks()
 
     def async_empty_queue_and_cancel_tasks(self) -> None:
         """Empty the queue."""
 
-        while not self._queue.empty():
+        while self._queue is not None and not self._queue.empty():
             self._queue.get_nowait()
             self._queue.task_done()
 
@@ -128,12 +207,18 @@ class ProbePlusDevice:
         if self.connected:
             return
 
-        if self.last_disconnect_time and self.last_disconnect_time > (time.time() - 15):
+        if self.last_disconnect_time and self.last_disconnect_time > (
+            time.time() - self._reconnect_delay
+        ):
             _LOGGER.debug(
-                "Probe has recently been disconnected, waiting 15 seconds before reconnecting"
+                "Probe has recently been disconnected, waiting %s seconds before reconnecting",
+                self._reconnect_delay,
             )
             return
 
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+
         self._client = BleakClient(
             address_or_ble_device=self.address_or_ble_device,
             disconnected_callback=self.device_disconnected_handler,
@@ -179,13 +264,20 @@ class ProbePlusDevice:
         """Setup background tasks"""
         if not self.process_queue_task or self.process_queue_task.done():
             self.process_queue_task = asyncio.create_task(self.process_queue())
+            self.process_queue_task.add_done_callback(self._process_queue_done)
+
+    def _process_queue_done(self, task: asyncio.Task) -> None:
+        """Drop the reference to a finished queue task."""
+        if self.process_queue_task is task:
+            self.process_queue_task = None
 
     async def disconnect(self) -> None:
         """Clean disconnect from the probe."""
 
         _LOGGER.debug("Disconnecting from probe")
         self.connected = False
-        await self._queue.join()
+        if self._queue is not None:
+            await self._queue.join()
         if not self._client:
             return
         try:
@@ -201,7 +293,13 @@ class ProbePlusDevice:
         data: bytearray,
     ) -> None:
         """Receive data from probe."""
-        _LOGGER.debug("%s: Notification received: %s", self.mac, data.hex())
-        self._device_state.parse_data(data)
-        if self._notify_callback is not None:
-            self._notify_callback()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Notification received: %s", self._mac, data.hex())
+        if (
+            self._device_state.parse_data(data) is not None
+            and self._notify_handle is None
+        ):
+            # coalesce probe and relay packets arriving back to back
+            self._notify_handle = asyncio.get_running_loop().call_later(
+                NOTIFY_DEBOUNCE, self._flush_callbacks
+            )
@@ -1 +1,7 @@
 BLE_DATA_RECEIVE = "0000ff01-0000-1000-8000-00805f9b34fb"
+
+# seconds to coalesce state updates before notifying callbacks
+NOTIFY_DEBOUNCE = 0.05
+
+# seconds to wait after a disconnect before connecting again
+RECONNECT_DELAY = 15
@@ -1,77 +1,144 @@
 """Device BLE Parser."""
 
+from __future__ import annotations
+
 import logging
 import struct
 
-from dataclasses import dataclass
+from bisect import bisect_right
+from collections.abc import Callable
 
 _LOGGER = logging.getLogger(__name__)
 
-@dataclass
+_U16BE = struct.Struct(">H")
+_U16LE = struct.Struct("<H")
+
+# battery level lookups, level index is bisect_right(thresholds, value)
+_PROBE_BATTERY_THRESHOLDS = (1.5, 1.7, 2.0)  # volts
+_PROBE_BATTERY_LEVELS = (20, 26, 51, 100)
+# relay thresholds are in raw millivolts so the > 3.87 V step stays exact
+_RELAY_BATTERY_THRESHOLDS = (3600, 3700, 3871)
+_RELAY_BATTERY_LEVELS = (0, 49, 74, 100)
+
 class ProbePlusData:
     """Represents data from PP."""
-    relay_battery: float | None = None
-    relay_voltage: float | None = None
-    relay_status: int | None = None
-    probe_battery: float | None = None
-    probe_voltage: float | None = None
-    probe_temperature: float | None = None
-    probe_rssi: float | None = None
+
+    __slots__ = (
+        "relay_battery",
+        "relay_voltage",
+        "relay_status",
+        "probe_battery",
+        "probe_voltage",
+        "probe_temperature",
+        "probe_rssi",
+    )
+
+    def __init__(
+        self,
+        relay_battery: float | None = None,
+        relay_voltage: float | None = None,
+        relay_status: int | None = None,
+        probe_battery: float | None = None,
+        probe_voltage: float | None = None,
+        probe_temperature: float | None = None,
+        probe_rssi: float | None = None,
+    ) -> None:
+        self.relay_battery = relay_battery
+        self.relay_voltage = relay_voltage
+        self.relay_status = relay_status
+        self.probe_battery = probe_battery
+        self.probe_voltage = probe_voltage
+        self.probe_temperature = probe_temperature
+        self.probe_rssi = probe_rssi
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
 
 class ParserBase:
     """ParserBase"""
 
-    state: ProbePlusData = ProbePlusData()
-
-    def parse_data(self, data: bytearray):
-        """Handle data notification updates from the device."""
-        probe_channels = [0]  # Hardcoded probe channels
-
-        _LOGGER.debug(">> Received data notification: %s", data.hex())
-
-        if len(data) == 9 and data[0] == 0x00 and data[1] == 0x00:
-            # probe state
-            d = data[3] * 0.03125
-            if d >= 2.0:
-                self.state.probe_battery = 100
-            elif d >= 1.7:
-                self.state.probe_battery = 51
-            elif d >= 1.5:
-                self.state.probe_battery = 26
-            else:
-                self.state.probe_battery = 20
-            temp_bytes = data[4:6]
-            temp_bytes = bytearray([temp_bytes[1], temp_bytes[0]])
-            _LOGGER.debug(">> Temperature state %s", temp_bytes.hex())
-            _LOGGER.debug(">> Unpacked temperature %s", struct.unpack(">H", temp_bytes)[0])
-            self.state.probe_temperature = (
-                (struct.unpack(">H", temp_bytes)[0] * 0.0625) - 50.0625
-            )
-            _LOGGER.debug(">> Parsed temperature: %s", self.state.probe_temperature)
-            self.state.probe_rssi = data[8]
-            return self.state
-
-        elif len(data) == 8 and data[0] == 0x00 and data[1] == 0x01:
-            # relay state
-            voltage_bytes = data[2:4]
-            self.state.relay_voltage = struct.unpack(">H", voltage_bytes)[0] / 1000.0
-            _LOGGER.debug(">> Voltage state %s", voltage_bytes.hex())
-            if self.state.relay_voltage > 3.87:
-                self.state.relay_battery = 100
-            elif self.state.relay_voltage >= 3.7:
-                self.state.relay_battery = 74
-            elif self.state.relay_voltage >= 3.6:
-                self.state.relay_battery = 49
-            else:
-                self.state.relay_battery = 0
-
-            for channel in probe_channels:
-                if len(data) > 4: # check to avoid index out of range errors
-                    status_byte = data[4] # Directly access the 5th byte (index 4)
-                    self.state.relay_status = int(status_byte)
-                    break
-                self.state.relay_status = None
-            _LOGGER.debug(">> Relay state %s", self.state.relay_status)
-            return self.state
-
-        return self.state
+    def __init__(self) -> None:
+        """Initialize the parser."""
+        self.state: ProbePlusData = ProbePlusData()
+        # two byte packet header -> packet parser, parsers check the length
+        self._parsers: dict[bytes, Callable[[bytearray], ProbePlusData | None]] = {
+            b"\x00\x00": self._parse_probe,
+            b"\x00\x01": self._parse_relay,
+        }
+
+    def parse_data(self, data: bytearray) -> ProbePlusData | None:
+        """Handle data notification updates from the device.
+
+        Returns None when the packet is not recognised or did not change the state.
+        """
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(">> Received data notification: %s", data.hex())
+
+        parser = self._parsers.get(bytes(data[:2]))
+        if parser is None:
+            _LOGGER.debug(">> Ignoring unrecognised notification")
+            return None
+        return parser(data)
+
+    def _parse_probe(self, data: bytearray) -> ProbePlusData | None:
+        """Parse a probe state packet."""
+        if len(data) != 9:
+            return None
+        state = self.state
+        previous = (
+            state.probe_battery,
+            state.probe_temperature,
+            state.probe_rssi,
+        )
+        d = data[3] * 0.03125
+        state.probe_battery = _PROBE_BATTERY_LEVELS[
+            bisect_right(_PROBE_BATTERY_THRESHOLDS, d)
+        ]
+        # temperature is little-endian, read it in place
+        raw_temp = _U16LE.unpack_from(data, 4)[0]
+        _LOGGER.debug(">> Unpacked temperature %s", raw_temp)
+        state.probe_temperature = (raw_temp * 0.0625) - 50.0625
+        _LOGGER.debug(">> Parsed temperature: %s", state.probe_temperature)
+        state.probe_rssi = data[8]
+        if previous == (
+            state.probe_battery,
+            state.probe_temperature,
+            state.probe_rssi,
+        ):
+            return None
+        return state
+
+    def _parse_relay(self, data: bytearray) -> ProbePlusData | None:
+        """Parse a relay state packet."""
+        if len(data) != 8:
+            return None
+        state = self.state
+        previous = (
+            state.relay_battery,
+            state.relay_voltage,
+            state.relay_status,
+        )
+        raw_voltage = _U16BE.unpack_from(data, 2)[0]
+        state.relay_voltage = raw_voltage / 1000.0
+        _LOGGER.debug(">> Unpacked voltage %s", raw_voltage)
+        state.relay_battery = _RELAY_BATTERY_LEVELS[
+            bisect_right(_RELAY_BATTERY_THRESHOLDS, raw_voltage)
+        ]
+        # relay packets are always 8 bytes long, the status is the 5th byte
+        state.relay_status = data[4]
+        _LOGGER.debug(">> Relay state %s", state.relay_status)
+        if previous == (
+            state.relay_battery,
+            state.relay_voltage,
+            state.relay_status,
+        ):
+            return None
+        return state